@@ -1,34 +1,270 @@
+import random
 import tkinter as tk
 from tkinter import messagebox
+from collections import deque
 from typing import Optional
 from a3_support import *
 
+# The game is stored as a bitboard: a single 64-bit integer made of 16 nibbles
+# (4 bits each). The nibble at index (row * NUM_COLS + column) holds the log2
+# of the tile at that position, or 0 if the tile is empty. Each row of the game
+# is therefore a 16-bit integer, with column 0 in its lowest nibble.
+
+def _encode_tile(tile: Optional[int]) -> int:
+    """
+    Returns:
+        int: The nibble for a tile number (its log2), or 0 for an empty tile.
+    """
+    if tile is None:
+        return 0
+    return min(tile.bit_length() - 1, 0xF)
+
+def _decode_tile(nibble: int) -> Optional[int]:
+    """
+    Returns:
+        Optional[int]: The tile number for a nibble, or None for an empty tile.
+    """
+    if nibble == 0:
+        return None
+    return 1 << nibble
+
+def _reverse_row(row: int) -> int:
+    """
+    Returns:
+        int: The 16-bit row with the order of its 4 nibbles reversed.
+    """
+    return (((row & 0xF000) >> 12) | ((row & 0x0F00) >> 4)
+        | ((row & 0x00F0) << 4) | ((row & 0x000F) << 12))
+
+def _transpose(board: int) -> int:
+    """
+    Returns:
+        int: The bitboard with its rows and columns swapped.
+    """
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+def _empty_nibbles(board: int) -> int:
+    """
+    Returns:
+        int: A bitboard with a 1 in each nibble of board that is 0,
+            and 0 in every other nibble.
+    """
+    board |= board >> 1
+    board |= board >> 2
+    return ~board & 0x1111111111111111
+
+def _move_row_left(row: int) -> tuple[int, int, int]:
+    """
+    Moves the tiles of a single row to the left, stacking and merging them
+    in one pass over the row.
+
+    Parameters:
+        row (int): The 16-bit row to move, with column 0 in its lowest nibble.
+
+    Returns:
+        tuple[int, int, int]: The row after moving left, the score gained,
+            and the largest tile made by a merge (0 if there were no merges).
+    """
+    moved_row = 0
+    score = 0
+    max_merged = 0
+    to_fill = 0 # The column where the next tile is placed.
+    pending = 0 # The last placed tile, if it can still be merged.
+    for column in range(NUM_COLS):
+        nibble = (row >> (4 * column)) & 0xF
+        if nibble == 0:
+            continue
+        
+        if nibble == pending:
+            # Merges with the last placed tile, which can't merge again.
+            merged = min(nibble + 1, 0xF)
+            moved_row += (merged - nibble) << (4 * (to_fill - 1))
+            score += 1 << (nibble + 1)
+            max_merged = max(max_merged, 1 << (nibble + 1))
+            pending = 0
+        else:
+            moved_row |= nibble << (4 * to_fill)
+            to_fill += 1
+            pending = nibble
+    return moved_row, score, max_merged
+
+def _unpack_column(row: int) -> int:
+    """
+    Returns:
+        int: A bitboard with the 4 nibbles of the 16-bit row placed down
+            column 0, from top to bottom.
+    """
+    return ((row & 0x000F) | ((row & 0x00F0) << 12)
+        | ((row & 0x0F00) << 24) | ((row & 0xF000) << 36))
+
+def _build_row_tables() -> tuple[list[int], list[int], list[int],
+    list[int], list[int], list[int]]:
+    """
+    Moves every possible row (2^16 of them) once in each direction, using
+    _move_row_left().
+    
+    The score and merge tables are shared by all directions, since a row
+    makes the same merges when it is moved either way.
+
+    Returns:
+        tuple[list[int], list[int], list[int], list[int], list[int],
+            list[int]]:
+            The row after moving left, the row after moving right, the row
+            moved left (up) and the row moved right (down) as column 0 of a
+            bitboard, the score gained, and the largest tile made by a merge,
+            all indexed by the original row.
+    """
+    row_table = []
+    score_table = []
+    merge_table = []
+    for row in range(1 << 16):
+        moved_row, score, max_merged = _move_row_left(row)
+        row_table.append(moved_row)
+        score_table.append(score)
+        merge_table.append(max_merged)
+    
+    row_right_table = [_reverse_row(row_table[_reverse_row(row)])
+        for row in range(1 << 16)]
+    column_up_table = [_unpack_column(row) for row in row_table]
+    column_down_table = [_unpack_column(row) for row in row_right_table]
+    return (row_table, row_right_table, column_up_table, column_down_table,
+        score_table, merge_table)
+
+(_row_table, _row_right_table, _column_up_table, _column_down_table,
+    _score_table, _merge_table) = _build_row_tables()
+
+
+def _move_rows(board: int, row_table: list[int]) -> tuple[int, int, int]:
+    """
+    Moves every row of a bitboard by looking it up in a row table.
+
+    Returns:
+        tuple[int, int, int]: The bitboard after the move, the score gained,
+            and the largest tile made by a merge.
+    """
+    moved_board = 0
+    score = 0
+    max_merged = 0
+    for row_index in range(NUM_ROWS):
+        shift = 16 * row_index
+        row = (board >> shift) & 0xFFFF
+        moved_board |= row_table[row] << shift
+        score += _score_table[row]
+        max_merged = max(max_merged, _merge_table[row])
+    return moved_board, score, max_merged
+
+def _move_columns(board: int, column_table: list[int]) \
+    -> tuple[int, int, int]:
+    """
+    Moves every column of a bitboard by using _transpose() to read each
+    column as a row, and looking it up in a column table, which writes it
+    back as a column.
+
+    Returns:
+        tuple[int, int, int]: The bitboard after the move, the score gained,
+            and the largest tile made by a merge.
+    """
+    transposed = _transpose(board)
+    moved_board = 0
+    score = 0
+    max_merged = 0
+    for column_index in range(NUM_COLS):
+        column = (transposed >> (16 * column_index)) & 0xFFFF
+        moved_board |= column_table[column] << (4 * column_index)
+        score += _score_table[column]
+        max_merged = max(max_merged, _merge_table[column])
+    return moved_board, score, max_merged
+
+def _move_left(board: int) -> tuple[int, int, int]:
+    """
+    Returns:
+        tuple[int, int, int]: The result of _move_rows() for a left move.
+    """
+    return _move_rows(board, _row_table)
+
+def _move_right(board: int) -> tuple[int, int, int]:
+    """
+    Returns:
+        tuple[int, int, int]: The result of _move_rows() for a right move.
+    """
+    return _move_rows(board, _row_right_table)
+
+def _move_up(board: int) -> tuple[int, int, int]:
+    """
+    Returns:
+        tuple[int, int, int]: The result of _move_columns() for an up move.
+    """
+    return _move_columns(board, _column_up_table)
+
+def _move_down(board: int) -> tuple[int, int, int]:
+    """
+    Returns:
+        tuple[int, int, int]: The result of _move_columns() for a down move.
+    """
+    return _move_columns(board, _column_down_table)
+
+def _has_lost(board: int) -> bool:
+    """
+    A bitboard is lost if there are 0 empty tiles left and no two
+    neighbouring tiles (horizontally or vertically) are equal,
+    since then no move can change it.
+
+    Returns:
+        bool: True if the bitboard is lost, but False if it is not.
+    """
+    if _empty_nibbles(board):
+        return False
+    
+    # A nibble is 0 in these when a tile equals the tile to its right
+    # (horizontal) or the tile below it (vertical). The masks ignore the
+    # last column and the last row, which have no such neighbour.
+    horizontal = _empty_nibbles(board ^ (board >> 4))
+    vertical = _empty_nibbles(board ^ (board >> 16))
+    return not (horizontal & 0x0111011101110111
+        or vertical & 0x0000111111111111)
+
+
 class Model():
     """
-    Sets the gameplay for the game using a list of lists (matrix),
+    Sets the gameplay for the game using a bitboard (a 64-bit integer),
     including the ability to start a new game, attempt moves, and undo moves.
     """
     def __init__(self) -> None:
         """
         Sets the variables that store the current game state,
-        previous states (for undo), score, and number of undos.
+        previous states (for undo), score, largest tile, and number of undos.
         """
-        self._game = []
-        self._previous_state = []
+        self._board = 0
+        self._previous_state = deque(maxlen=MAX_UNDOS)
         self._score = 0
+        self._max_tile = 0
         self._undos = MAX_UNDOS
+        
+        # The move method for each key from "wasd".
+        self._moves = {
+            LEFT: self.move_left,
+            RIGHT: self.move_right,
+            UP: self.move_up,
+            DOWN: self.move_down}
     
     def new_game(self) -> None:
         """
-        Turns the state of the game to a matrix of empty tiles.
-        It also resets the score and number of undos.
+        Turns the state of the game to a board of empty tiles.
+        It also resets the score, largest tile, and number of undos.
         
         This method must be executed before starting a game.
         """
         self._score = 0
+        self._max_tile = 0
         self._undos = MAX_UNDOS
-        self._game = [[None for column in range(NUM_COLS)] \
-            for row in range(NUM_ROWS)]
+        self._board = 0
     
     def get_score(self) -> int:
         """
@@ -37,77 +273,103 @@ class Model():
         """
         return self._score
     
+    def get_board(self) -> int:
+        """
+        Returns:
+            int: Gets the current bitboard of the game.
+        """
+        return self._board
+    
+    def get_empty_count(self) -> int:
+        """
+        Returns:
+            int: Gets the current number of empty tiles in the game.
+        """
+        return bin(_empty_nibbles(self._board)).count("1")
+    
     def get_tiles(self) -> list[list[Optional[int]]]:
         """
+        Decodes the bitboard into a list of lists (matrix).
+        
         Returns:
             list[list[Optional[int]]]: Gets the current list of
                 lists (matrix) of the game.
         """
-        return self._game
+        return [[_decode_tile(
+            (self._board >> (4 * (row * NUM_COLS + column))) & 0xF)
+            for column in range(NUM_COLS)] for row in range(NUM_ROWS)]
     
     def add_tile(self) -> None:
         """
-        Adds a tile to the game (list of lists) if there is an empty tile in
-        the game.
+        Adds a tile to the game if there is an empty tile in the game.
         
-        The new generated tile is a randomized number of either 2 or 4.
-        This is done using generate_tile() from a3_support.py.
+        The new generated tile is placed on a random empty nibble of the
+        bitboard, and is a randomized number of either 2 or 4 with the same
+        odds as generate_tile() from a3_support.py.
         """
+        empty = _empty_nibbles(self._board)
         
-        # Get a list of empty tiles in the game using list comprehension.
-        empty_tiles = [None for row in self._game if None in row]
+        # Gets the bit position of every empty nibble in the game.
+        empty_positions = []
+        while empty:
+            lowest = empty & -empty
+            empty_positions.append(lowest.bit_length() - 1)
+            empty ^= lowest
         
         # Generates and adds a tile to the game if there are empty tiles.
-        if len(empty_tiles) != 0:
-            new_tile = generate_tile(self._game)
-            (row, column), tile_number = new_tile
-            self._game[row][column] = tile_number
+        # The nibble for a 2 is 1, and the nibble for a 4 is 2.
+        if empty_positions:
+            position = random.choice(empty_positions)
+            self._board |= random.choice([1] * 5 + [2]) << position
+    
+    def _apply_move(self, move_result: tuple[int, int, int]) -> None:
+        """
+        Sets the game to the bitboard from a move, adds to the current score
+        of the game, and updates the largest tile made by a merge.
+
+        Parameters:
+            move_result (tuple[int, int, int]): The result of one of the
+                _move_*() functions on the current game.
+        """
+        self._board, score, max_merged = move_result
+        self._score += score
+        self._max_tile = max(self._max_tile, max_merged)
     
     def move_left(self) -> None:
         """
-        Moves all the game's tiles to the left using stack_left() and
-        combine_left() from a3_support.
+        Moves all the game's tiles to the left using _move_left().
         
-        It also adds to the current score of the game.
+        It also adds to the current score of the game, and updates the
+        largest tile made by a merge.
         """
-        stacked_left = stack_left(self._game)
-        merged_tiles, score = combine_left(stacked_left)
-        self._game = stack_left(merged_tiles)
-        self._score += score
+        self._apply_move(_move_left(self._board))
         
     def move_right(self) -> None:
         """
-        Moves all the game's tiles to the right by using 
-        reverse() (from a3_support) and move_left().
+        Moves all the game's tiles to the right using _move_right().
         
-        It also adds to the current score of the game.
+        It also adds to the current score of the game, and updates the
+        largest tile made by a merge.
         """
-        self._game = reverse(self._game)
-        self.move_left()
-        self._game = reverse(self._game)
-        
+        self._apply_move(_move_right(self._board))
     
     def move_up(self) -> None:
         """
-        Moves all the game's tiles up by using
-        transpose() (from a3_support) and move_left().
+        Moves all the game's tiles up using _move_up().
         
-        It also adds to the current score of the game.
+        It also adds to the current score of the game, and updates the
+        largest tile made by a merge.
         """
-        self._game = transpose(self._game)
-        self.move_left()
-        self._game = transpose(self._game)
+        self._apply_move(_move_up(self._board))
     
     def move_down(self) -> None:
         """
-        Moves all the game's tiles down by using
-        transpose() (from a3_support), and move_right().
+        Moves all the game's tiles down using _move_down().
         
-        It also adds to the current score of the game.
+        It also adds to the current score of the game, and updates the
+        largest tile made by a merge.
         """
-        self._game = transpose(self._game)
-        self.move_right()
-        self._game = transpose(self._game)
+        self._apply_move(_move_down(self._board))
     
     def get_undos_remaining(self) -> int:
         """
@@ -134,33 +396,29 @@ class Model():
 
         Returns:
             bool: True if the state of the game as changed, but
-                False if the game has stayed the same after the move.
+                False if the game has stayed the same after the move or
+                the move is not from "wasd".
         """
-        previous_state = self._game
-        previous_score = self._score
+        move_method = self._moves.get(move)
+        if move_method is None:
+            return False
+        
+        # The board is a single int, so this is a full snapshot of the game.
+        previous_state, previous_score, previous_max_tile = \
+            self._board, self._score, self._max_tile
         
-        if move == "a":
-            self.move_left()
-        if move == "d":
-            self.move_right()
-        if move == "w":
-            self.move_up()
-        if move == "s":
-            self.move_down()
+        move_method()
         
         # Since the game can be undoed up to 3 times, the previous 3 states of
         # the game must be stored. Hence, each state is added 
-        # to self._previous state.
+        # to self._previous state, which drops its oldest state when full.
         
-        if previous_state != self._game:
-            if len(self._previous_state) != MAX_UNDOS:
-                self._previous_state.append((previous_state, previous_score))
-            else:
-                self._previous_state.pop(0)
-                self._previous_state.append((previous_state, previous_score))
+        changed = previous_state != self._board
+        if changed:
+            self._previous_state.append(
+                (previous_state, previous_score, previous_max_tile))
         
-        
-        return previous_state != self._game
+        return changed
     
     def use_undo(self) -> None:
         """
@@ -170,71 +428,46 @@ class Model():
         """
         # The method does not undo if there are no undos remaining or if the
         # game is back to its initial state.
-        if self._undos < 1 or len(self._previous_state) == 0:
+        if self._undos < 1 or not self._previous_state:
             return
         
-        # Stores the index of the previous move for self._previous_state.
-        previous_game = len(self._previous_state)-1
-        
-        # Sets the current game and score to the previous state, and removes
-        # the previous state from self._previous_state.
-        self._game, self._score = self._previous_state.pop(previous_game)
+        # Sets the current game, score, and largest tile to the previous
+        # state, and removes the previous state from self._previous_state.
+        self._board, self._score, self._max_tile = self._previous_state.pop()
         self._undos -= 1
     
     def has_won(self) -> bool:
         """
         The players has won if the game has a tile with 2048.
+        
+        A 2048 tile can only be made by a merge, so this checks the largest
+        tile made by a merge instead of searching the game.
 
         Returns:
             bool: Returns True if there is a tile with 2048 in the game,
                 but False if there is not.
         """
-        # Appends to win_tile if the game has at least one 2048 tile
-        # using list comprehension.
-        win_tile = [2048 for row in self._game if 2048 in row]
-        
-        if len(win_tile) > 0:
-            return True
-        else:
-            return False
+        return self._max_tile >= 2048
     
     def has_lost(self) -> bool:
         """
         The players has lost if there are 0 empty tiles left and 
-        a move does not result in a change in the game.
+        no two neighbouring tiles (horizontally or vertically) are equal,
+        since then no move can change the game. This is checked by
+        _has_lost().
+        
+        The game itself is not changed by this method.
 
         Returns:
             bool: Returns True if the player has lost according to the
                 conditions above, but False if the player has not lost.
         """
-        # Stores the previous state of the game to check if any move can 
-        # change the state of the game in the future.
-        previous_state = self._game
-        previous_score = self._score
-        
-        # Appends None to empty_tile if there are any empty tiles in the game.
-        empty_tiles = [None for row in self._game if None in row]
-        
-        if len(empty_tiles) == 0:
-            # Executes all 4 moves to see if any move can change the
-            # state of the game.
-            self.move_left()
-            self.move_right()
-            self.move_up()
-            self.move_down()
-            
-            # Player has lost if the current game state is the same as the
-            # previous game state. However, if it is different, then the 
-            # game is reverted back to its state at the start of has_lost().
-            
-            if self._game == previous_state:
-                return True
-            else:
-                self._game = previous_state
-                self._score = previous_score
-                return False
-        else:
-            return False
+        return _has_lost(self._board)
+
+
+# The label shown on the canvas for every tile that fits in a nibble.
+_LABEL_CACHE = {None: ""} | {1 << nibble: str(1 << nibble)
+    for nibble in range(1, 16)}
 
 
 class GameGrid(tk.Canvas):
@@ -256,6 +489,29 @@ class GameGrid(tk.Canvas):
         bg=BACKGROUND_COLOUR,
         **kwargs)
         
+        # The positions of the tiles never change, so their coordinates are
+        # calculated once here and looked up whenever the game is drawn.
+        self._bbox = tuple(tuple(
+            ((column*100)+(BUFFER-5), (row*100)+(BUFFER-5),
+            ((column+1)*100)-(BUFFER-5), ((row+1)*100)-(BUFFER-5))
+            for column in range(NUM_COLS)) for row in range(NUM_ROWS))
+        self._midpoint = tuple(tuple(
+            ((column*100)+50, (row*100)+50)
+            for column in range(NUM_COLS)) for row in range(NUM_ROWS))
+        
+        # Creates an empty tile and label for every position once. They are
+        # updated in place by redraw() instead of being recreated.
+        self._rect_ids = [[self.create_rectangle(
+            self._bbox[row][column],
+            fill=COLOURS.get(None),
+            outline=BACKGROUND_COLOUR)
+            for column in range(NUM_COLS)] for row in range(NUM_ROWS)]
+        self._text_ids = [[self.create_text(
+            self._midpoint[row][column],
+            text="",
+            font=TILE_FONT)
+            for column in range(NUM_COLS)] for row in range(NUM_ROWS)]
+        
     def _get_bbox(self, position: tuple[int, int]) \
         -> tuple[int, int, int, int]:
         """
@@ -271,8 +527,7 @@ class GameGrid(tk.Canvas):
                 and bottom right corner for the tile to be shown on the canvas.
         """
         row, column = position
-        return ((column*100)+(BUFFER-5), (row*100)+(BUFFER-5),
-        ((column+1)*100)-(BUFFER-5), ((row+1)*100)-(BUFFER-5))
+        return self._bbox[row][column]
     
     def _get_midpoint(self, position: tuple[int, int]) -> tuple[int, int]:
         """
@@ -289,48 +544,51 @@ class GameGrid(tk.Canvas):
             shown on the canvas.
         """
         row, column = position
-        return ((column*100)+50, (row*100)+50)
+        return self._midpoint[row][column]
     
     
     def clear(self) -> None:
         """
-        Clears the entire canvas to draw the new state of the game.
+        Clears the entire canvas by showing every tile as empty.
         """
-        self.delete("all")
+        self.redraw(0, 0xFFFFFFFFFFFFFFFF)
     
     
-    def redraw(self, tiles: list[list[Optional[int]]]) -> None:
+    def redraw(self, board: int, changed_mask: int) -> None:
         """
         Draws the current state of the game.
         
-        It uses create_rectangle() to create the tile on the canvas,
-        and create_text() to create the label for that tile.
-        Both of these methods are inherited from tk.Canvas.
+        It uses itemconfig() to update the tiles and labels that have changed
+        since the last redraw. This method is inherited from tk.Canvas.
 
         Paramters:
-            tiles (list[list[Optional[int]]]): The current state of the game,
-                in the form of a list of lists.
+            board (int): The current state of the game, as a bitboard.
+            changed_mask (int): The bits of the board that have changed since
+                the last redraw (the old and new boards XORed together).
         """
-        self.clear() # Clears the canvas to draw the new state of the game.
+        # Reduces the mask to the lowest bit of each changed nibble.
+        changed = changed_mask | (changed_mask >> 1)
+        changed |= changed >> 2
+        changed &= 0x1111111111111111
         
-        # Iterate through every tile in the game, and create a tile and 
-        # label for it on the canvas based on its indexed position.
+        # Iterate through every changed tile in the game, and update the tile
+        # and label at its indexed position.
         # The colours and font are set based on a3_support.
-        for row_index, row in enumerate(tiles):
-            for tile_index, tile in enumerate(row):
-                position = [row_index, tile_index]
-                
-                self.create_rectangle(
-                    self._get_bbox(position),
-                    fill=COLOURS.get(tile),
-                    outline=BACKGROUND_COLOUR)
-                
-                if tile != None:
-                    self.create_text(
-                        self._get_midpoint(position),
-                        text=str(tile),
-                        font=TILE_FONT,
-                        fill=FG_COLOURS.get(tile))
+        while changed:
+            position = ((changed & -changed).bit_length() - 1) >> 2
+            row_index, tile_index = divmod(position, NUM_COLS)
+            tile = _decode_tile((board >> (4 * position)) & 0xF)
+            
+            self.itemconfig(
+                self._rect_ids[row_index][tile_index],
+                fill=COLOURS.get(tile))
+            
+            self.itemconfig(
+                self._text_ids[row_index][tile_index],
+                text=_LABEL_CACHE[tile],
+                fill=FG_COLOURS.get(tile))
+            
+            changed &= changed - 1
 
 class StatusBar(tk.Frame):
     """
@@ -425,6 +683,10 @@ class StatusBar(tk.Frame):
             font=NUMBER_FONT)
         self._undo_number.pack(expand=True)
         
+        # The score and undos remaining that are currently shown.
+        self._last_score = None
+        self._last_undos = None
+        
         
         # Buttons for 'new game' and 'undo game'
         # The command for the buttons will be set in the Game() class.
@@ -451,11 +713,16 @@ class StatusBar(tk.Frame):
             score (int): The current score of the game.
             undos (int): The current number of undos remaining.
         """
-        self._score_number.config(
-            text=str(score))
+        # The labels are only updated if their quantities have changed.
+        if score != self._last_score:
+            self._score_number.config(
+                text=str(score))
+            self._last_score = score
         
-        self._undo_number.config(
-            text=str(undos))
+        if undos != self._last_undos:
+            self._undo_number.config(
+                text=str(undos))
+            self._last_undos = undos
     
     def set_callbacks(self, new_game_command: callable, \
         undo_command: callable) -> None:
@@ -509,8 +776,14 @@ class Game():
         
         # Initialises the visual aspects of the game.
         self._view = GameGrid(self._root)
+        self._drawn_board = 0 # The board currently shown by GameGrid.
         self._statusbar = StatusBar(self._root)
         
+        # The after() IDs of new tiles that are yet to be added, oldest first,
+        # and the callback that adds them, which is only bound once.
+        self._pending_tiles = deque()
+        self._new_tile_callback = self.add_pending_tile
+        
         # Sets the commands for the 'new game' and 'undo game' buttons.
         self._statusbar.set_callbacks(
             self.start_new_game,
@@ -535,7 +808,9 @@ class Game():
         Draws the current state of the game in the canvas within the window.
         Updates the label for score and undos remaining in StatusBar.
         """
-        self._view.redraw(self._game.get_tiles())
+        board = self._game.get_board()
+        self._view.redraw(board, board ^ self._drawn_board)
+        self._drawn_board = board
         self._statusbar.redraw_infos(self._game.get_score(),
         self._game.get_undos_remaining())
     
@@ -562,15 +837,14 @@ class Game():
     def attempt_move(self, event: tk.Event) -> None:
         """
         Attempts a move based on the corresponding keypress, and redraws the
-        new state of the game with draw().
+        new state of the game with draw() if the move changed the game.
 
         Parameters:
             event (tk.Event): the key press of the player.
         """
-        if event.char not in "wasd":
+        if not self._game.attempt_move(event.char):
             return
         
-        self._game.attempt_move(event.char)
         self.draw()
         
         # A message box is displayed if the game has been won, but a new tile
@@ -578,7 +852,16 @@ class Game():
         if self._game.has_won():
             self.message_box(WIN_MESSAGE) # Opens the messagebox for a win.
         else:
-            self._view.after(NEW_TILE_DELAY, self.new_tile)
+            self._pending_tiles.append(
+                self._view.after(NEW_TILE_DELAY, self._new_tile_callback))
+    
+    def add_pending_tile(self) -> None:
+        """
+        Adds the oldest new tile that is waiting to be added after a move,
+        using new_tile().
+        """
+        self._pending_tiles.popleft()
+        self.new_tile()
     
     def new_tile(self) -> None:
         """
@@ -590,7 +873,10 @@ class Game():
         """
         self._game.add_tile()
         self.draw()
-        if self._game.has_lost():
+        
+        # The game can't be lost while there are empty tiles, such as when
+        # the first tiles of a new game are added.
+        if self._game.get_empty_count() == 0 and self._game.has_lost():
             self.message_box(LOSS_MESSAGE) # Opens the messagebox for a loss.
     
     def undo_previous_move(self) -> None:
@@ -605,7 +891,13 @@ class Game():
         """
         Starts a new game by resetting Model to an empty grid, and redraws
         the new state of the game with two tiles to begin with.
+        
+        Any new tiles that are still waiting to be added from the previous
+        game are cancelled.
         """
+        while self._pending_tiles:
+            self._view.after_cancel(self._pending_tiles.popleft())
+        
         self._game.new_game()
         self.draw()
         for num in range(2):